@@ -9,7 +9,8 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntityDescription,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
@@ -78,6 +79,23 @@ class FritzBoxBinarySensor(FritzBoxBaseEntity, BinarySensorEntity):
         self._attr_unique_id = f"{fritzbox_tools.unique_id}-{description.key}"
         super().__init__(fritzbox_tools, device_friendly_name)
 
+    async def async_added_to_hass(self) -> None:
+        """Register state update callback."""
+        if self.entity_description.key != "firmware_update":
+            return
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                self._fritzbox_tools.signal_firmware_update,
+                self.async_on_firmware_update,
+            )
+        )
+
+    @callback
+    def async_on_firmware_update(self) -> None:
+        """Refresh the firmware update state."""
+        self.async_schedule_update_ha_state(True)
+
     def update(self) -> None:
         """Update data."""
         _LOGGER.debug("Updating FRITZ!Box binary sensors")
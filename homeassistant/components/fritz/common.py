@@ -1,12 +1,14 @@
 """Support for AVM FRITZ!Box classes."""
 from __future__ import annotations
 
-from collections.abc import Callable, ValuesView
+import asyncio
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 import logging
+import time
 from types import MappingProxyType
-from typing import Any, TypedDict, cast
+from typing import Any, NamedTuple, TypedDict, cast
 
 from fritzconnection import FritzConnection
 from fritzconnection.core.exceptions import (
@@ -33,7 +35,7 @@ from homeassistant.helpers.device_registry import (
     async_entries_for_config_entry,
     async_get,
 )
-from homeassistant.helpers.dispatcher import dispatcher_send
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_registry import (
     EntityRegistry,
@@ -48,32 +50,29 @@ from .const import (
     DEFAULT_PORT,
     DEFAULT_USERNAME,
     DOMAIN,
+    FIRMWARE_CHECK_INTERVAL,
+    MAX_PARALLEL_WAN_ACCESS_CALLS,
     SERVICE_CLEANUP,
     SERVICE_REBOOT,
     SERVICE_RECONNECT,
+    WAN_ACCESS_CACHE_TTL,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
-
-def _is_tracked(mac: str, current_devices: ValuesView) -> bool:
-    """Check if device is already tracked."""
-    for tracked in current_devices:
-        if mac in tracked:
-            return True
-    return False
+_DEFAULT_CONSIDER_HOME_SECONDS = DEFAULT_CONSIDER_HOME.total_seconds()
 
 
 def device_filter_out_from_trackers(
     mac: str,
     device: FritzDevice,
-    current_devices: ValuesView,
+    current_macs: frozenset[str],
 ) -> bool:
     """Check if device should be filtered out from trackers."""
     reason: str | None = None
     if device.ip_address == "":
         reason = "Missing IP"
-    elif _is_tracked(mac, current_devices):
+    elif mac in current_macs:
         reason = "Already tracked"
 
     if reason:
@@ -83,13 +82,6 @@ def device_filter_out_from_trackers(
     return bool(reason)
 
 
-def _cleanup_entity_filter(device: RegistryEntry) -> bool:
-    """Filter only relevant entities."""
-    return device.domain == DEVICE_TRACKER_DOMAIN or (
-        device.domain == DEVICE_SWITCH_DOMAIN and "_internet_access" in device.entity_id
-    )
-
-
 class ClassSetupMissing(Exception):
     """Raised when a Class func is called before setup."""
 
@@ -98,8 +90,7 @@ class ClassSetupMissing(Exception):
         super().__init__("Function called before Class setup")
 
 
-@dataclass
-class Device:
+class Device(NamedTuple):
     """FRITZ!Box device class."""
 
     mac: str
@@ -152,6 +143,9 @@ class FritzBoxTools(update_coordinator.DataUpdateCoordinator):
         self._current_firmware: str | None = None
         self._latest_firmware: str | None = None
         self._update_available: bool = False
+        self._last_firmware_check: float | None = None
+        self._wan_access_cache: dict[str, tuple[str, float, bool]] = {}
+        self._wan_access_generation: dict[str, int] = {}
 
     async def async_setup(
         self, options: MappingProxyType[str, Any] | None = None
@@ -175,6 +169,7 @@ class FritzBoxTools(update_coordinator.DataUpdateCoordinator):
             _LOGGER.error("Unable to establish a connection with %s", self.host)
             return
 
+        self.fritz_hosts = FritzHosts(fc=self.connection)
         self.fritz_status = FritzStatus(fc=self.connection)
         info = self.connection.call_action("DeviceInfo:1", "GetInfo")
         if not self._unique_id:
@@ -184,12 +179,11 @@ class FritzBoxTools(update_coordinator.DataUpdateCoordinator):
         self._current_firmware = info.get("NewSoftwareVersion")
 
         self._update_available, self._latest_firmware = self._update_device_info()
+        self._last_firmware_check = time.monotonic()
 
-    @callback
     async def _async_update_data(self) -> None:
         """Update FritzboxTools data."""
         try:
-            self.fritz_hosts = FritzHosts(fc=self.connection)
             await self.async_scan_devices()
         except (FritzSecurityError, FritzConnectionException) as ex:
             raise update_coordinator.UpdateFailed from ex
@@ -247,6 +241,11 @@ class FritzBoxTools(update_coordinator.DataUpdateCoordinator):
         """Event specific per FRITZ!Box entry to signal updates in devices."""
         return f"{DOMAIN}-device-update-{self._unique_id}"
 
+    @property
+    def signal_firmware_update(self) -> str:
+        """Event specific per FRITZ!Box entry to signal firmware state changes."""
+        return f"{DOMAIN}-firmware-update-{self._unique_id}"
+
     def _update_hosts_info(self) -> list[HostInfo]:
         """Retrieve latest hosts information from the FRITZ!Box."""
         try:
@@ -263,64 +262,160 @@ class FritzBoxTools(update_coordinator.DataUpdateCoordinator):
         )
         return bool(version), version
 
-    async def async_scan_devices(self, now: datetime | None = None) -> None:
-        """Wrap up FritzboxTools class scan."""
-        await self.hass.async_add_executor_job(self.scan_devices, now)
+    def _get_wan_access(self, ip_address: str) -> bool:
+        """Retrieve WAN access rule for the given IP address from the FRITZ!Box."""
+        wan_access = self.connection.call_action(
+            "X_AVM-DE_HostFilter:1",
+            "GetWANAccessByIP",
+            NewIPv4Address=ip_address,
+        )
+        if wan_access:
+            return not wan_access.get("NewDisallow")
+        return True
+
+    async def _async_get_wan_access(self, ip_addresses: list[str]) -> dict[str, bool]:
+        """Retrieve WAN access rules for several IP addresses in parallel."""
+        semaphore = asyncio.Semaphore(MAX_PARALLEL_WAN_ACCESS_CALLS)
+
+        async def _async_get(ip_address: str) -> bool:
+            async with semaphore:
+                return await self.hass.async_add_executor_job(
+                    self._get_wan_access, ip_address
+                )
+
+        results = await asyncio.gather(*(_async_get(ip) for ip in ip_addresses))
+        return dict(zip(ip_addresses, results))
+
+    def _cached_wan_access(self, host: HostInfo, timestamp: float) -> bool | None:
+        """Return the cached WAN access rule of a host if it is still valid."""
+        if (cached := self._wan_access_cache.get(host["ip"])) is None:
+            return None
+        mac, cached_at, allowed = cached
+        if mac != host["mac"] or timestamp - cached_at >= WAN_ACCESS_CACHE_TTL:
+            return None
+        return allowed
 
-    def scan_devices(self, now: datetime | None = None) -> None:
+    @callback
+    def async_invalidate_wan_access(self, ip_address: str) -> None:
+        """Drop the cached WAN access rule for the given IP address."""
+        self._wan_access_cache.pop(ip_address, None)
+        # Results of fetches already running for this address are outdated too
+        self._wan_access_generation[ip_address] = (
+            self._wan_access_generation.get(ip_address, 0) + 1
+        )
+
+    async def _async_update_wan_access(
+        self, hosts: list[HostInfo], timestamp: float
+    ) -> dict[str, bool]:
+        """Return WAN access rules by IP address, fetching only outdated ones."""
+        wan_access: dict[str, bool] = {}
+        outdated_hosts: dict[str, str] = {}
+        for host in hosts:
+            if not (ip_address := host["ip"]):
+                continue
+            if (allowed := self._cached_wan_access(host, timestamp)) is None:
+                outdated_hosts[ip_address] = host["mac"]
+            else:
+                wan_access[ip_address] = allowed
+
+        generation = self._wan_access_generation.copy()
+        fetched = await self._async_get_wan_access(list(outdated_hosts))
+        wan_access.update(fetched)
+
+        # Forget addresses that are no longer on the network
+        self._wan_access_cache = {
+            ip_address: cached
+            for ip_address, cached in self._wan_access_cache.items()
+            if ip_address in wan_access
+        }
+        for ip_address, allowed in fetched.items():
+            if self._wan_access_generation.get(ip_address) == generation.get(
+                ip_address
+            ):
+                self._wan_access_cache[ip_address] = (
+                    outdated_hosts[ip_address],
+                    timestamp,
+                    allowed,
+                )
+        self._wan_access_generation = {
+            ip_address: count
+            for ip_address, count in self._wan_access_generation.items()
+            if ip_address in wan_access
+        }
+
+        return wan_access
+
+    async def async_scan_devices(self, now: datetime | None = None) -> None:
         """Scan for new devices and return a list of found device ids."""
         _LOGGER.debug("Checking devices for FRITZ!Box router %s", self.host)
 
-        _default_consider_home = DEFAULT_CONSIDER_HOME.total_seconds()
         if self._options:
             consider_home = self._options.get(
-                CONF_CONSIDER_HOME, _default_consider_home
+                CONF_CONSIDER_HOME, _DEFAULT_CONSIDER_HOME_SECONDS
             )
         else:
-            consider_home = _default_consider_home
+            consider_home = _DEFAULT_CONSIDER_HOME_SECONDS
 
-        new_device = False
-        for known_host in self._update_hosts_info():
-            if not known_host.get("mac"):
-                continue
+        hosts_info = await self.hass.async_add_executor_job(self._update_hosts_info)
+        known_hosts = [known_host for known_host in hosts_info if known_host.get("mac")]
+
+        timestamp = time.monotonic()
+        wan_access = await self._async_update_wan_access(known_hosts, timestamp)
 
+        new_device = False
+        changed_macs: set[str] = set()
+        for known_host in known_hosts:
             dev_mac = known_host["mac"]
             dev_name = known_host["name"]
             dev_ip = known_host["ip"]
             dev_home = known_host["status"]
             dev_wan_access = True
             if dev_ip:
-                wan_access = self.connection.call_action(
-                    "X_AVM-DE_HostFilter:1",
-                    "GetWANAccessByIP",
-                    NewIPv4Address=dev_ip,
-                )
-                if wan_access:
-                    dev_wan_access = not wan_access.get("NewDisallow")
+                dev_wan_access = wan_access[dev_ip]
 
             dev_info = Device(dev_mac, dev_ip, dev_name, dev_wan_access)
 
             if dev_mac in self._devices:
-                self._devices[dev_mac].update(dev_info, dev_home, consider_home)
+                device = self._devices[dev_mac]
+                previous_state = device.state
+                device.update(dev_info, dev_home, consider_home)
+                if device.state != previous_state:
+                    changed_macs.add(dev_mac)
             else:
                 device = FritzDevice(dev_mac, dev_name)
                 device.update(dev_info, dev_home, consider_home)
                 self._devices[dev_mac] = device
                 new_device = True
+                changed_macs.add(dev_mac)
 
-        dispatcher_send(self.hass, self.signal_device_update)
+        if changed_macs:
+            async_dispatcher_send(self.hass, self.signal_device_update, changed_macs)
         if new_device:
-            dispatcher_send(self.hass, self.signal_device_new)
+            async_dispatcher_send(self.hass, self.signal_device_new)
+
+        if (
+            self._last_firmware_check is not None
+            and timestamp - self._last_firmware_check < FIRMWARE_CHECK_INTERVAL
+        ):
+            return
 
         _LOGGER.debug("Checking host info for FRITZ!Box router %s", self.host)
-        self._update_available, self._latest_firmware = self._update_device_info()
+        (
+            self._update_available,
+            self._latest_firmware,
+        ) = await self.hass.async_add_executor_job(self._update_device_info)
+        self._last_firmware_check = timestamp
 
     async def async_trigger_firmware_update(self) -> bool:
         """Trigger firmware update."""
         results = await self.hass.async_add_executor_job(
             self.connection.call_action, "UserInterface:1", "X_AVM-DE_DoUpdate"
         )
-        return cast(bool, results["NewX_AVM-DE_UpdateState"])
+        if update_started := cast(bool, results["NewX_AVM-DE_UpdateState"]):
+            # The update is being installed, don't wait for the next check to tell
+            self._update_available = False
+            async_dispatcher_send(self.hass, self.signal_firmware_update)
+        return update_started
 
     async def async_trigger_reboot(self) -> None:
         """Trigger device reboot."""
@@ -385,12 +480,18 @@ class FritzBoxTools(update_coordinator.DataUpdateCoordinator):
         )
         entities_removed: bool = False
 
-        device_hosts_macs = {device["mac"] for device in device_hosts_list}
+        device_hosts_macs = frozenset(device["mac"] for device in device_hosts_list)
 
         for entry in ha_entity_reg_list:
             if (
-                not _cleanup_entity_filter(entry)
-                or entry.unique_id.split("_")[0] in device_hosts_macs
+                not (
+                    entry.domain == DEVICE_TRACKER_DOMAIN
+                    or (
+                        entry.domain == DEVICE_SWITCH_DOMAIN
+                        and "_internet_access" in entry.entity_id
+                    )
+                )
+                or entry.unique_id.partition("_")[0] in device_hosts_macs
             ):
                 continue
             _LOGGER.info("Removing entity: %s", entry.name or entry.original_name)
@@ -433,6 +534,7 @@ class FritzDeviceBase(update_coordinator.CoordinatorEntity):
         """Initialize a FRITZ!Box device."""
         super().__init__(router)
         self._router = router
+        self._device = device
         self._mac: str = device.mac_address
         self._name: str = device.hostname or DEFAULT_DEVICE_NAME
 
@@ -445,7 +547,7 @@ class FritzDeviceBase(update_coordinator.CoordinatorEntity):
     def ip_address(self) -> str | None:
         """Return the primary ip address of the device."""
         if self._mac:
-            return self._router.devices[self._mac].ip_address
+            return self._device.ip_address
         return None
 
     @property
@@ -457,7 +559,7 @@ class FritzDeviceBase(update_coordinator.CoordinatorEntity):
     def hostname(self) -> str | None:
         """Return hostname of the device."""
         if self._mac:
-            return self._router.devices[self._mac].hostname
+            return self._device.hostname
         return None
 
     @property
@@ -499,17 +601,18 @@ class FritzDevice:
         self._name = name
         self._ip_address: str | None = None
         self._last_activity: datetime | None = None
+        self._last_activity_monotonic: float | None = None
         self._connected = False
         self._wan_access = False
 
     def update(self, dev_info: Device, dev_home: bool, consider_home: float) -> None:
         """Update device info."""
-        utc_point_in_time = dt_util.utcnow()
+        point_in_time = time.monotonic()
 
-        if self._last_activity:
+        if self._last_activity_monotonic is not None:
             consider_home_evaluated = (
-                utc_point_in_time - self._last_activity
-            ).total_seconds() < consider_home
+                point_in_time - self._last_activity_monotonic < consider_home
+            )
         else:
             consider_home_evaluated = dev_home
 
@@ -519,11 +622,17 @@ class FritzDevice:
         self._connected = dev_home or consider_home_evaluated
 
         if dev_home:
-            self._last_activity = utc_point_in_time
+            self._last_activity = dt_util.utcnow()
+            self._last_activity_monotonic = point_in_time
 
         self._ip_address = dev_info.ip_address
         self._wan_access = dev_info.wan_access
 
+    @property
+    def state(self) -> tuple[str | None, bool, bool]:
+        """Return the values that are refreshed on every scan."""
+        return self._ip_address, self._connected, self._wan_access
+
     @property
     def is_connected(self) -> bool:
         """Return connected status."""
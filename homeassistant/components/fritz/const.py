@@ -27,6 +27,10 @@ ERROR_AUTH_INVALID = "invalid_auth"
 ERROR_CANNOT_CONNECT = "cannot_connect"
 ERROR_UNKNOWN = "unknown_error"
 
+FIRMWARE_CHECK_INTERVAL = 6 * 60 * 60
+MAX_PARALLEL_WAN_ACCESS_CALLS = 8
+WAN_ACCESS_CACHE_TTL = 300
+
 FRITZ_SERVICES = "fritz_services"
 SERVICE_REBOOT = "reboot"
 SERVICE_RECONNECT = "reconnect"
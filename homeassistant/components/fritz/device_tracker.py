@@ -101,8 +101,9 @@ def _async_add_entities(
     if router.unique_id not in data_fritz.tracked:
         data_fritz.tracked[router.unique_id] = set()
 
+    tracked_macs: frozenset[str] = frozenset().union(*data_fritz.tracked.values())
     for mac, device in router.devices.items():
-        if device_filter_out_from_trackers(mac, device, data_fritz.tracked.values()):
+        if device_filter_out_from_trackers(mac, device, tracked_macs):
             continue
 
         new_tracked.append(FritzBoxTracker(router, device))
@@ -123,7 +124,7 @@ class FritzBoxTracker(FritzDeviceBase, ScannerEntity):
     @property
     def is_connected(self) -> bool:
         """Return device status."""
-        return self._router.devices[self._mac].is_connected
+        return self._device.is_connected
 
     @property
     def unique_id(self) -> str:
@@ -141,7 +142,7 @@ class FritzBoxTracker(FritzDeviceBase, ScannerEntity):
     def extra_state_attributes(self) -> dict[str, str]:
         """Return the attributes."""
         attrs: dict[str, str] = {}
-        self._last_activity = self._router.devices[self._mac].last_activity
+        self._last_activity = self._device.last_activity
         if self._last_activity is not None:
             attrs["last_time_reachable"] = self._last_activity.isoformat(
                 timespec="seconds"
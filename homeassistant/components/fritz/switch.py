@@ -291,10 +291,11 @@ def profile_entities_list(
     if router.unique_id not in data_fritz.profile_switches:
         data_fritz.profile_switches[router.unique_id] = set()
 
+    tracked_macs: frozenset[str] = frozenset().union(
+        *data_fritz.profile_switches.values()
+    )
     for mac, device in router.devices.items():
-        if device_filter_out_from_trackers(
-            mac, device, data_fritz.profile_switches.values()
-        ):
+        if device_filter_out_from_trackers(mac, device, tracked_macs):
             continue
 
         new_profiles.append(FritzBoxProfileSwitch(router, device))
@@ -598,7 +599,7 @@ class FritzBoxProfileSwitch(FritzDeviceBase, SwitchEntity):
     @property
     def is_on(self) -> bool:
         """Switch status."""
-        return self._router.devices[self._mac].wan_access
+        return self._device.wan_access
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on switch."""
@@ -624,6 +625,8 @@ class FritzBoxProfileSwitch(FritzDeviceBase, SwitchEntity):
             NewIPv4Address=self.ip_address,
             NewDisallow="0" if turn_on else "1",
         )
+        if self.ip_address:
+            self._router.async_invalidate_wan_access(self.ip_address)
 
 
 class FritzBoxWifiSwitch(FritzBoxBaseSwitch, SwitchEntity):
@@ -32,12 +32,14 @@ from homeassistant.helpers.update_coordinator import (
 )
 
 from .const import (
-    ATTR_SDS011,
-    ATTR_SPS30,
     DEFAULT_NAME,
     DEFAULT_UPDATE_INTERVAL,
+    DEPRECATED_AIR_QUALITY_TYPES,
     DOMAIN,
     MANUFACTURER,
+    UPDATE_ATTEMPT_TIMEOUT,
+    UPDATE_ATTEMPTS,
+    UPDATE_TIMEOUT,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -71,7 +73,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     # Remove air_quality entities from registry if they exist
     ent_reg = entity_registry.async_get(hass)
-    for sensor_type in ("sds", ATTR_SDS011, ATTR_SPS30):
+    for sensor_type in DEPRECATED_AIR_QUALITY_TYPES:
         unique_id = f"{coordinator.unique_id}-{sensor_type}"
         if entity_id := ent_reg.async_get_entity_id(
             AIR_QUALITY_PLATFORM, DOMAIN, unique_id
@@ -111,19 +113,33 @@ class NAMDataUpdateCoordinator(DataUpdateCoordinator):
 
     async def _async_update_data(self) -> NAMSensors:
         """Update data via library."""
+        # Device firmware uses synchronous code and doesn't respond to http queries
+        # when reading data from sensors. The nettigo-air-quality library tries to
+        # get the data 4 times with a backoff, so every attempt gets a timeout longer
+        # than that and only a stuck request is sent again.
+        async with async_timeout.timeout(UPDATE_TIMEOUT):
+            for attempt in range(1, UPDATE_ATTEMPTS):
+                try:
+                    return await self._async_fetch_data()
+                except asyncio.TimeoutError:
+                    _LOGGER.debug(
+                        "Timeout fetching data from %s, attempt %s",
+                        self.nam.host,
+                        attempt,
+                    )
+
+            return await self._async_fetch_data()
+
+    async def _async_fetch_data(self) -> NAMSensors:
+        """Fetch data from the device once."""
         try:
-            # Device firmware uses synchronous code and doesn't respond to http queries
-            # when reading data from sensors. The nettigo-air-quality library tries to
-            # get the data 4 times, so we use a longer than usual timeout here.
-            async with async_timeout.timeout(30):
-                data = await self.nam.async_update()
+            async with async_timeout.timeout(UPDATE_ATTEMPT_TIMEOUT):
+                return await self.nam.async_update()
         # We do not need to catch AuthFailed exception here because sensor data is
         # always available without authorization.
         except (ApiError, ClientConnectorError, InvalidSensorData) as error:
             raise UpdateFailed(error) from error
 
-        return data
-
     @property
     def unique_id(self) -> str | None:
         """Return a unique_id."""
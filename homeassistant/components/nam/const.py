@@ -57,8 +57,13 @@ ATTR_SPS30_P2: Final = f"{ATTR_SPS30}{SUFFIX_P2}"
 ATTR_SPS30_P4: Final = f"{ATTR_SPS30}{SUFFIX_P4}"
 ATTR_UPTIME: Final = "uptime"
 
+DEPRECATED_AIR_QUALITY_TYPES: Final = ("sds", ATTR_SDS011, ATTR_SPS30)
+
 DEFAULT_NAME: Final = "Nettigo Air Monitor"
 DEFAULT_UPDATE_INTERVAL: Final = timedelta(minutes=6)
+UPDATE_ATTEMPT_TIMEOUT: Final = 30
+UPDATE_ATTEMPTS: Final = 2
+UPDATE_TIMEOUT: Final = 45
 DOMAIN: Final = "nam"
 MANUFACTURER: Final = "Nettigo"
 
@@ -2,10 +2,11 @@
 from __future__ import annotations
 
 from datetime import timedelta
+import re
 from typing import Any
 
 from async_timeout import timeout
-from pynina import ApiError, Nina, Warning as NinaWarning
+from pynina import ApiError, Nina
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
@@ -28,6 +29,8 @@ from .const import (
 
 PLATFORMS: list[str] = [Platform.BINARY_SENSOR]
 
+_CORONA_RE: re.Pattern[str] = re.compile("corona", re.IGNORECASE)
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up platform from a ConfigEntry."""
@@ -80,27 +83,19 @@ class NINADataUpdateCoordinator(DataUpdateCoordinator):
         """Parse warning data."""
 
         return_data: dict[str, Any] = {}
+        corona_filter: bool = self.corona_filter
 
-        for (
-            region_id
-        ) in self._nina.warnings:  # pylint: disable=consider-using-dict-items
-            raw_warnings: list[NinaWarning] = self._nina.warnings[region_id]
-
-            warnings_for_regions: list[Any] = []
-
-            for raw_warn in raw_warnings:
-                if "corona" in raw_warn.headline.lower() and self.corona_filter:
-                    continue
-
-                warn_obj: dict[str, Any] = {
+        for region_id, raw_warnings in self._nina.warnings.items():
+            return_data[region_id] = [
+                {
                     ATTR_ID: raw_warn.id,
                     ATTR_HEADLINE: raw_warn.headline,
                     ATTR_SENT: raw_warn.sent or "",
                     ATTR_START: raw_warn.start or "",
                     ATTR_EXPIRES: raw_warn.expires or "",
                 }
-                warnings_for_regions.append(warn_obj)
-
-            return_data[region_id] = warnings_for_regions
+                for raw_warn in raw_warnings
+                if not (corona_filter and _CORONA_RE.search(raw_warn.headline))
+            ]
 
         return return_data
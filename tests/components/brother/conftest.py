@@ -0,0 +1,20 @@
+"""Fixtures for Brother Printer tests."""
+import json
+from unittest.mock import patch
+
+import pytest
+
+from tests.common import load_fixture
+
+
+@pytest.fixture(name="printer_data", scope="module")
+def printer_data_fixture():
+    """Load printer data fixture once per module."""
+    return json.loads(load_fixture("printer_data.json", "brother"))
+
+
+@pytest.fixture(name="mock_get_data")
+def mock_get_data_fixture(printer_data):
+    """Mock the printer data fetch for the duration of a test."""
+    with patch("brother.Brother._get_data", return_value=printer_data) as mock:
+        yield mock
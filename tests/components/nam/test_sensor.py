@@ -1,7 +1,9 @@
 """Test sensor of Nettigo Air Monitor integration."""
+import asyncio
 from datetime import timedelta
 from unittest.mock import AsyncMock, Mock, patch
 
+from aiohttp.client_exceptions import ClientConnectorError
 from nettigo_air_monitor import ApiError
 
 from homeassistant.components.nam.const import DOMAIN
@@ -422,6 +424,79 @@ async def test_availability(hass):
     assert state.state == "7.6"
 
 
+async def test_availability_on_timeout(hass):
+    """Ensure that a timed out update is retried before marking entities unavailable."""
+    await init_integration(hass)
+
+    future = utcnow() + timedelta(minutes=6)
+    update_response = Mock(json=AsyncMock(return_value=nam_data))
+    with patch("homeassistant.components.nam.NettigoAirMonitor.initialize"), patch(
+        "homeassistant.components.nam.NettigoAirMonitor._async_http_request",
+        side_effect=[asyncio.TimeoutError, update_response],
+    ) as mock_request:
+        async_fire_time_changed(hass, future)
+        await hass.async_block_till_done()
+
+    assert mock_request.call_count == 2
+    state = hass.states.get("sensor.nettigo_air_monitor_bme280_temperature")
+    assert state
+    assert state.state == "7.6"
+
+    future = utcnow() + timedelta(minutes=12)
+    with patch("homeassistant.components.nam.NettigoAirMonitor.initialize"), patch(
+        "homeassistant.components.nam.NettigoAirMonitor._async_http_request",
+        side_effect=asyncio.TimeoutError,
+    ) as mock_request:
+        async_fire_time_changed(hass, future)
+        await hass.async_block_till_done()
+
+    assert mock_request.call_count == 2
+    state = hass.states.get("sensor.nettigo_air_monitor_bme280_temperature")
+    assert state
+    assert state.state == STATE_UNAVAILABLE
+
+
+async def test_availability_on_connection_error(hass, aioclient_mock):
+    """Ensure that connection errors are only retried by the library."""
+    await init_integration(hass)
+
+    aioclient_mock.get(
+        "http://10.10.2.3/data.json", exc=ClientConnectorError(Mock(), OSError())
+    )
+    future = utcnow() + timedelta(minutes=6)
+    with patch("nettigo_air_monitor.asyncio", sleep=AsyncMock()) as mock_asyncio:
+        async_fire_time_changed(hass, future)
+        await hass.async_block_till_done()
+
+    assert aioclient_mock.call_count == 4
+    assert mock_asyncio.sleep.call_count == 4
+    state = hass.states.get("sensor.nettigo_air_monitor_bme280_temperature")
+    assert state
+    assert state.state == STATE_UNAVAILABLE
+
+
+async def test_availability_on_stuck_request(hass, aioclient_mock):
+    """Ensure that a stuck request is sent again without the library backoff."""
+    await init_integration(hass)
+
+    async def stuck_request(method, url, data):
+        await asyncio.Event().wait()
+
+    aioclient_mock.get("http://10.10.2.3/data.json", side_effect=stuck_request)
+    future = utcnow() + timedelta(minutes=6)
+    with patch("homeassistant.components.nam.UPDATE_ATTEMPT_TIMEOUT", 0.01), patch(
+        "nettigo_air_monitor.asyncio", sleep=AsyncMock()
+    ) as mock_asyncio:
+        async_fire_time_changed(hass, future)
+        await hass.async_block_till_done()
+
+    assert aioclient_mock.call_count == 2
+    assert mock_asyncio.sleep.call_count == 0
+    state = hass.states.get("sensor.nettigo_air_monitor_bme280_temperature")
+    assert state
+    assert state.state == STATE_UNAVAILABLE
+
+
 async def test_manual_update_entity(hass):
     """Test manual update entity via service homeasasistant/update_entity."""
     await init_integration(hass)